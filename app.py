@@ -14,6 +14,9 @@ app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-producti
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///learning_pathways.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# Enriched pathways are large; keep API responses compact even in debug mode
+app.json.compact = True
+
 db = SQLAlchemy(app)
 
 # Initialize core engines
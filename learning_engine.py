@@ -1,5 +1,6 @@
 import json
 import math
+from collections import Counter, deque
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
@@ -48,6 +49,16 @@ class LearningPathway:
         if self.adaptation_metadata is None:
             self.adaptation_metadata = {}
 
+# Timeline choices offered by the pathway form, mapped to weeks
+_TIMELINE_WEEKS = {
+    '3-6 months': 18,   # Average 4.5 months
+    '6-12 months': 39,  # Average 9.75 months
+    '1-2 years': 78,    # Average 1.5 years
+    '2-3 years': 130,   # Average 2.5 years
+    '3+ years': 156     # 3 years
+}
+_TIMELINE_WEEKS_GET = _TIMELINE_WEEKS.get
+
 class LearningPathwayEngine:
     """
     Advanced learning pathway engine that:
@@ -383,11 +394,11 @@ class LearningPathwayEngine:
                         in_degree[skill] += 1
         
         # Kahn's algorithm
-        queue = [skill for skill in in_degree if in_degree[skill] == 0]
+        queue = deque(skill for skill in in_degree if in_degree[skill] == 0)
         result = []
         
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             result.append(current)
             
             for neighbor in graph.get(current, []):
@@ -396,9 +407,11 @@ class LearningPathwayEngine:
                     queue.append(neighbor)
         
         # Add any remaining skills not in dependency graph
+        placed = set(result)
         for skill in skills:
-            if skill not in result:
+            if skill not in placed:
                 result.append(skill)
+                placed.add(skill)
         
         return result
     
@@ -681,33 +694,24 @@ class LearningPathwayEngine:
             'session_length': preferences.get('session_length', 60)
         }
     
-    def _parse_timeline(self, timeline: str) -> int:
+    @staticmethod
+    def _parse_timeline(timeline: str) -> int:
         """Parse timeline string to weeks"""
-        timeline_mapping = {
-            '3-6 months': 18,   # Average 4.5 months
-            '6-12 months': 39,  # Average 9.75 months  
-            '1-2 years': 78,    # Average 1.5 years
-            '2-3 years': 130,   # Average 2.5 years
-            '3+ years': 156     # 3 years
-        }
-        return timeline_mapping.get(timeline, 26)  # Default to 6 months
+        return _TIMELINE_WEEKS_GET(timeline, 26)  # Default to 6 months
     
     def _determine_module_difficulty(self, skills: List[str]) -> str:
         """Determine module difficulty based on constituent skills"""
-        difficulties = []
-        for skill in skills:
-            if skill in self.skill_dependencies:
-                difficulties.append(self.skill_dependencies[skill].get('difficulty', 'intermediate'))
+        difficulty_counts = Counter(
+            self.skill_dependencies[skill].get('difficulty', 'intermediate')
+            for skill in skills
+            if skill in self.skill_dependencies
+        )
         
-        if not difficulties:
+        if not difficulty_counts:
             return 'intermediate'
         
-        # Return the most common difficulty level
-        difficulty_counts = {}
-        for diff in difficulties:
-            difficulty_counts[diff] = difficulty_counts.get(diff, 0) + 1
-        
-        return max(difficulty_counts.items(), key=lambda x: x[1])[0]
+        # Return the most common difficulty level (ties go to the first seen)
+        return difficulty_counts.most_common(1)[0][0]
     
     def _generate_pathway_title(self, career_goals: List[str], focus_areas: List[str]) -> str:
         """Generate an engaging title for the learning pathway"""
@@ -775,53 +779,36 @@ class LearningPathwayEngine:
         difficulty_ratings = feedback.get('difficulty_ratings', {})
         engagement_scores = feedback.get('engagement_scores', {})
         
-        analysis = {
-            'overall_progress': sum(completion_rates.values()) / len(completion_rates) if completion_rates else 0,
-            'learning_velocity': self._calculate_learning_velocity(time_spent, completion_rates),
-            'struggle_areas': self._identify_struggle_areas(completion_rates, difficulty_ratings),
-            'engagement_level': sum(engagement_scores.values()) / len(engagement_scores) if engagement_scores else 3,
-            'time_efficiency': self._calculate_time_efficiency(time_spent)
-        }
-        
-        return analysis
-    
-    def _calculate_learning_velocity(self, time_spent: Dict, completion_rates: Dict) -> float:
-        """Calculate how quickly the user is learning"""
-        if not time_spent or not completion_rates:
-            return 1.0
-        
-        # Calculate average completion rate per hour
-        total_time = sum(time_spent.values())
+        # Reduce each feedback series once and share the totals across metrics
         total_completion = sum(completion_rates.values())
+        total_time = sum(time_spent.values())
+        difficulty_for = difficulty_ratings.get
         
-        if total_time > 0:
-            return total_completion / total_time
-        return 1.0
-    
-    def _identify_struggle_areas(self, completion_rates: Dict, difficulty_ratings: Dict) -> List[str]:
-        """Identify areas where the user is struggling"""
-        struggle_areas = []
-        
-        for topic, completion in completion_rates.items():
-            difficulty = difficulty_ratings.get(topic, 3)
-            
-            # If completion is low and difficulty is rated high
-            if completion < 0.6 and difficulty > 3:
-                struggle_areas.append(topic)
-        
-        return struggle_areas
-    
-    def _calculate_time_efficiency(self, time_spent: Dict) -> float:
-        """Calculate how efficiently the user is using their time"""
-        if not time_spent:
-            return 1.0
+        # Learning velocity: average completion rate per unit of time spent
+        if completion_rates and total_time > 0:
+            learning_velocity = total_completion / total_time
+        else:
+            learning_velocity = 1.0
         
-        # Compare actual time spent vs estimated time
+        # Time efficiency: expected average minutes per topic vs actual average
         # This is a simplified calculation - in practice would use more sophisticated metrics
-        avg_time = sum(time_spent.values()) / len(time_spent)
-        expected_avg = 60  # Expected average minutes per topic
+        expected_avg = 60
+        if total_time > 0:
+            time_efficiency = min(expected_avg / (total_time / len(time_spent)), 2.0)
+        else:
+            time_efficiency = 1.0
         
-        return min(expected_avg / avg_time, 2.0) if avg_time > 0 else 1.0
+        analysis = {
+            'overall_progress': total_completion / len(completion_rates) if completion_rates else 0,
+            'learning_velocity': learning_velocity,
+            # Struggling: low completion on a topic rated as difficult
+            'struggle_areas': [topic for topic, completion in completion_rates.items()
+                               if completion < 0.6 and difficulty_for(topic, 3) > 3],
+            'engagement_level': sum(engagement_scores.values()) / len(engagement_scores) if engagement_scores else 3,
+            'time_efficiency': time_efficiency
+        }
+        
+        return analysis
     
     def _identify_adaptation_needs(self, performance_analysis: Dict) -> Dict:
         """Identify what adaptations are needed based on performance"""
@@ -872,10 +859,13 @@ class LearningPathwayEngine:
         if adaptation_needs['content_type_changes']:
             adaptations_applied.append(f"Changed content types: {', '.join(adaptation_needs['content_type_changes'])}")
         
+        # Read the clock once so the review date is exactly two weeks out
+        now = datetime.now()
+        
         return {
             'pathway_id': pathway_id,
             'adaptations_applied': adaptations_applied,
-            'adaptation_timestamp': datetime.now().isoformat(),
+            'adaptation_timestamp': now.isoformat(),
             'performance_metrics': feedback,
-            'next_review_date': (datetime.now() + timedelta(weeks=2)).isoformat()
+            'next_review_date': (now + timedelta(weeks=2)).isoformat()
         }
\ No newline at end of file
@@ -1,13 +1,21 @@
 import requests
 import json
 import re
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+import hashlib
+import heapq
+import itertools
+from typing import Dict, List, Any, Optional, Tuple, FrozenSet
+from dataclasses import dataclass
 from urllib.parse import quote, urlencode
 import time
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Resource:
     id: str
     title: str
@@ -19,15 +27,150 @@ class Resource:
     difficulty: str = "intermediate"  # beginner, intermediate, advanced
     rating: Optional[float] = None
     enrollment_count: Optional[int] = None
-    tags: List[str] = None
+    tags: Tuple[str, ...] = ()
     language: str = "en"
     last_updated: Optional[str] = None
     instructor: Optional[str] = None
     thumbnail: Optional[str] = None
     
     def __post_init__(self):
-        if self.tags is None:
-            self.tags = []
+        # Accept any iterable of tags (or None) but always store a tuple
+        if type(self.tags) is not tuple:
+            object.__setattr__(self, 'tags', tuple(self.tags or ()))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the resource fields (cheaper than dataclasses.asdict)"""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data['tags'] = list(self.tags)
+        return data
+
+# Shared tag tuples for the prebuilt database resources
+_TAG_TUPLES = {}
+
+def _intern_tags(tags: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return the shared instance of an equal tag tuple"""
+    return _TAG_TUPLES.setdefault(tags, tags)
+
+# Quoted form of a search query for URLs (the same terms recur across topics)
+_quote_query = lru_cache(maxsize=1024)(quote)
+
+@lru_cache(maxsize=4096)
+def _query_hash(query: str) -> str:
+    """Stable digest of a query for resource IDs (hash() is salted per process)"""
+    return hashlib.blake2b(query.encode('utf-8'), digest_size=8).hexdigest()
+
+# Unique suffixes for fallback resource IDs (cheaper than reading the clock)
+_fallback_ids = itertools.count(1)
+
+# Platform searches in flight at once (several topics x every platform)
+_SEARCH_WORKERS = 32
+
+# find_resources results are reused for an hour, for up to this many queries
+_RESOURCE_CACHE_SIZE = 1024
+_RESOURCE_CACHE_TTL = 3600  # seconds
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entries"""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+# Skill-to-keyword mapping for better search targeting
+_SKILL_KEYWORDS = {
+    'programming': ['programming', 'coding', 'software development', 'computer science'],
+    'python': ['python programming', 'python tutorial', 'python course'],
+    'javascript': ['javascript', 'js programming', 'web development'],
+    'data_analysis': ['data analysis', 'pandas', 'data science', 'statistics'],
+    'machine_learning': ['machine learning', 'ML', 'artificial intelligence', 'deep learning'],
+    'web_development': ['web development', 'frontend', 'backend', 'full stack'],
+    'algorithms': ['algorithms', 'data structures', 'computer science fundamentals'],
+    'databases': ['database', 'SQL', 'NoSQL', 'data modeling'],
+    'system_design': ['system design', 'architecture', 'scalability', 'distributed systems'],
+    'cybersecurity': ['cybersecurity', 'information security', 'ethical hacking', 'network security']
+}
+
+# Flat, group-indexed views of the keyword table: every term that identifies
+# a skill (its name plus keywords) and the top 2 keywords it expands to
+_SKILL_GROUP_TERMS = tuple((skill, *keywords) for skill, keywords in _SKILL_KEYWORDS.items())
+_SKILL_GROUP_EXPANSIONS = tuple(tuple(keywords[:2]) for keywords in _SKILL_KEYWORDS.values())
+
+# One capture group per skill, wrapped in a lookahead so a single scan
+# reports, at every position, the first skill in table order that starts
+# there. The lowest group seen is the first skill whose name or a keyword
+# occurs anywhere in the topic.
+_SKILL_TERMS_RE = re.compile('(?=(?:%s))' % '|'.join(
+    '(%s)' % '|'.join(map(re.escape, group_terms)) for group_terms in _SKILL_GROUP_TERMS
+))
+
+@lru_cache(maxsize=1024)
+def _expand_topic(topic: str) -> Tuple[str, ...]:
+    """Expand topic into related search terms (cached per topic)"""
+    terms = [topic]
+    
+    # Add specific keywords for the first known skill mentioned
+    topic_lower = topic.lower()
+    group = min((match.lastindex for match in _SKILL_TERMS_RE.finditer(topic_lower)), default=None)
+    if group is not None:
+        terms.extend(_SKILL_GROUP_EXPANSIONS[group - 1])  # Add top 2 related keywords
+    
+    # Remove duplicates (ignoring case) but keep the original order,
+    # so the most specific terms are searched first
+    unique_terms = {}
+    for term in terms:
+        unique_terms.setdefault(term.lower(), term)
+    return tuple(unique_terms.values())
+
+# Strips punctuation from titles before duplicate comparison
+_TITLE_NORM_RE = re.compile(r'[^\w\s]')
+# Same stripping for ASCII titles as a single str.translate pass
+_TITLE_NORM_TABLE = str.maketrans('', '', ''.join(filter(_TITLE_NORM_RE.match, map(chr, range(128)))))
+
+@lru_cache(maxsize=4096)
+def _title_tokens(title: str) -> frozenset:
+    """Lowercased word set of a resource title (cached per title)"""
+    return frozenset(title.lower().split())
+
+# Ranking weights: platform reliability (based on general quality)
+# and content type preferences
+_PLATFORM_SCORES = {
+    'youtube': 15, 'coursera': 25, 'edx': 25, 'khan_academy': 20,
+    'mit_ocw': 30, 'freecodecamp': 20, 'github': 10, 'medium': 10
+}
+_TYPE_PREFERENCES = {'course': 1.2, 'video': 1.1, 'interactive': 1.15, 'article': 1.0}
+_PLATFORM_SCORES_GET = _PLATFORM_SCORES.get
+_TYPE_PREFERENCES_GET = _TYPE_PREFERENCES.get
+
+# Difficulty match bonus for each requested level: exact level, or
+# intermediate content one step away
+_DIFFICULTY_BONUS = {
+    'beginner': {'beginner': 20, 'intermediate': 10},
+    'intermediate': {'intermediate': 20},
+    'advanced': {'advanced': 20, 'intermediate': 10},
+}
 
 class ResourceAggregator:
     """
@@ -57,34 +200,42 @@ class ResourceAggregator:
             'podcast': PodcastAggregator()
         }
         
-        # Skill-to-keyword mapping for better search targeting
-        self.skill_keywords = {
-            'programming': ['programming', 'coding', 'software development', 'computer science'],
-            'python': ['python programming', 'python tutorial', 'python course'],
-            'javascript': ['javascript', 'js programming', 'web development'],
-            'data_analysis': ['data analysis', 'pandas', 'data science', 'statistics'],
-            'machine_learning': ['machine learning', 'ML', 'artificial intelligence', 'deep learning'],
-            'web_development': ['web development', 'frontend', 'backend', 'full stack'],
-            'algorithms': ['algorithms', 'data structures', 'computer science fundamentals'],
-            'databases': ['database', 'SQL', 'NoSQL', 'data modeling'],
-            'system_design': ['system design', 'architecture', 'scalability', 'distributed systems'],
-            'cybersecurity': ['cybersecurity', 'information security', 'ethical hacking', 'network security']
+        # Long-lived worker pool for platform searches, shared by all topics
+        self._search_executor = ThreadPoolExecutor(max_workers=_SEARCH_WORKERS,
+                                                   thread_name_prefix='resource-search')
+        
+        # Recent find_resources results keyed on the search parameters
+        self._resource_cache = _TTLCache(_RESOURCE_CACHE_SIZE, _RESOURCE_CACHE_TTL)
+        
+        # Platforms that only answer queries mentioning certain terms, so
+        # searches that can't match are never dispatched
+        self._platform_triggers = {
+            platform_name: platform.trigger_pattern
+            for platform_name, platform in self.platforms.items()
+            if getattr(platform, 'trigger_pattern', None) is not None
         }
+        
+        # Skill-to-keyword mapping for better search targeting
+        self.skill_keywords = _SKILL_KEYWORDS
     
     def enrich_pathway(self, pathway: Dict) -> Dict:
         """Enrich a learning pathway with curated resources"""
         enriched_pathway = pathway.copy()
         
         if 'modules' in pathway:
-            for module in enriched_pathway['modules']:
-                if 'topics' in module:
-                    for topic in module['topics']:
-                        topic_name = topic.get('name', '')
-                        difficulty = topic.get('difficulty', 'intermediate')
-                        
-                        # Aggregate resources for this topic
-                        resources = self.find_resources(topic_name, difficulty, limit=10)
-                        topic['resources'] = [asdict(resource) for resource in resources]
+            topics = [topic for module in enriched_pathway['modules'] if 'topics' in module
+                      for topic in module['topics']]
+            
+            # Aggregate resources once per distinct (topic, difficulty), concurrently
+            topic_keys = [(topic.get('name', ''), topic.get('difficulty', 'intermediate')) for topic in topics]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {
+                    key: executor.submit(self.find_resources, key[0], key[1], limit=10)
+                    for key in dict.fromkeys(topic_keys)
+                }
+            
+            for topic, key in zip(topics, topic_keys):
+                topic['resources'] = [resource.to_dict() for resource in futures[key].result()]
         
         return enriched_pathway
     
@@ -93,85 +244,128 @@ class ResourceAggregator:
         """Find resources for a specific topic across all platforms"""
         if content_types is None:
             content_types = ['video', 'course', 'article', 'interactive']
+        # Platforms only test membership, and a frozenset doubles as the
+        # order-independent part of the cache key
+        content_types = frozenset(content_types)
+        
+        # Results only depend on these parameters, so repeated topics are
+        # served from the cache (the topic's casing shows up in fallback titles)
+        cache_key = (topic, difficulty, content_types, limit)
+        cached_resources = self._resource_cache.get(cache_key)
+        if cached_resources is not None:
+            return list(cached_resources)
         
         all_resources = []
         
         # Expand topic with related keywords
         search_terms = self._expand_search_terms(topic)
+        per_term_limit = limit // len(search_terms)
+        
+        search_terms = search_terms[:3]  # Limit to prevent too many API calls
+        lowered_terms = [search_term.lower() for search_term in search_terms]
         
+        # Query platforms concurrently; results are collected in platform
+        # order so deduplication and ranking stay deterministic
+        futures = []
         for platform_name, platform in self.platforms.items():
-            try:
-                for search_term in search_terms[:3]:  # Limit to prevent too many API calls
-                    resources = platform.search_resources(search_term, difficulty, content_types, limit//len(search_terms))
-                    all_resources.extend(resources)
-                    time.sleep(0.5)  # Rate limiting
-            except Exception as e:
-                print(f"Error fetching from {platform_name}: {e}")
-                continue
+            platform_terms = search_terms
+            trigger = self._platform_triggers.get(platform_name)
+            if trigger is not None:
+                platform_terms = [search_term for search_term, term_lower in zip(search_terms, lowered_terms)
+                                  if trigger.search(term_lower)]
+                if not platform_terms:
+                    continue
+            
+            futures.append(self._search_executor.submit(self._search_platform, platform_name, platform,
+                                                        platform_terms, difficulty, content_types,
+                                                        per_term_limit))
+        
+        complete = True
+        for future in futures:
+            resources, succeeded = future.result()
+            all_resources.extend(resources)
+            complete = complete and succeeded
         
         # Deduplicate and rank resources
         unique_resources = self._deduplicate_resources(all_resources)
-        ranked_resources = self._rank_resources(unique_resources, topic, difficulty)
+        ranked_resources = self._rank_resources(unique_resources, topic, difficulty, limit)
+        
+        # Don't pin partial results from a failing platform
+        if complete:
+            self._resource_cache.set(cache_key, ranked_resources)
         
-        return ranked_resources[:limit]
+        return list(ranked_resources)
+    
+    def _search_platform(self, platform_name: str, platform, search_terms: List[str], difficulty: str,
+                         content_types: FrozenSet[str], limit: int) -> Tuple[List[Resource], bool]:
+        """Search a single platform for each term.
+        Returns the resources found and whether every search succeeded."""
+        resources = []
+        try:
+            for search_term in search_terms:
+                resources.extend(platform.search_resources(search_term, difficulty, content_types, limit))
+        except Exception as e:
+            print(f"Error fetching from {platform_name}: {e}")
+            return resources, False
+        
+        return resources, True
     
     def _expand_search_terms(self, topic: str) -> List[str]:
         """Expand topic into related search terms"""
-        terms = [topic]
-        
-        # Add specific keywords for known skills
-        topic_lower = topic.lower()
-        for skill, keywords in self.skill_keywords.items():
-            if skill in topic_lower or any(keyword in topic_lower for keyword in keywords):
-                terms.extend(keywords[:2])  # Add top 2 related keywords
-                break
-        
-        return list(set(terms))  # Remove duplicates
+        # The keyword table is static, so expansions are memoized per topic
+        return list(_expand_topic(topic))
     
     def _deduplicate_resources(self, resources: List[Resource]) -> List[Resource]:
         """Remove duplicate resources based on title and URL similarity"""
         unique_resources = []
         seen_titles = set()
         seen_urls = set()
+        keep = unique_resources.append
+        add_title = seen_titles.add
+        add_url = seen_urls.add
+        norm_table = _TITLE_NORM_TABLE
+        norm_sub = _TITLE_NORM_RE.sub
         
         for resource in resources:
+            title = resource.title
+            url = resource.url
+            # Filter out very short titles and repeated URLs before
+            # paying for title normalization
+            if len(title) <= 10 or url in seen_urls:
+                continue
+            
             # Normalize title for comparison
-            normalized_title = re.sub(r'[^\w\s]', '', resource.title.lower())
+            title = title.lower()
+            normalized_title = title.translate(norm_table) if title.isascii() else norm_sub('', title)
             
-            if (normalized_title not in seen_titles and 
-                resource.url not in seen_urls and
-                len(resource.title) > 10):  # Filter out very short titles
-                
-                unique_resources.append(resource)
-                seen_titles.add(normalized_title)
-                seen_urls.add(resource.url)
+            if normalized_title not in seen_titles:
+                keep(resource)
+                add_title(normalized_title)
+                add_url(url)
         
         return unique_resources
     
-    def _rank_resources(self, resources: List[Resource], topic: str, difficulty: str) -> List[Resource]:
-        """Rank resources based on relevance, quality, and user preferences"""
+    def _rank_resources(self, resources: List[Resource], topic: str, difficulty: str,
+                        limit: Optional[int] = None) -> List[Resource]:
+        """Rank resources based on relevance, quality, and user preferences,
+        keeping only the top `limit` when given"""
+        # Topic tokens are the same for every resource
+        topic_words = topic.lower().split()
+        topic_word_set = frozenset(topic_words)
+        topic_word_count = len(topic_words)
+        
+        # Difficulty match (unknown levels only reward an exact match)
+        difficulty_bonus = _DIFFICULTY_BONUS.get(difficulty) or {difficulty: 20}
+        
         def calculate_score(resource: Resource) -> float:
-            score = 0.0
-            
             # Title relevance
-            topic_words = topic.lower().split()
-            title_words = resource.title.lower().split()
-            title_relevance = len(set(topic_words) & set(title_words)) / len(topic_words)
-            score += title_relevance * 30
+            score = len(topic_word_set & _title_tokens(resource.title)) / topic_word_count * 30
             
             # Difficulty match
-            if resource.difficulty == difficulty:
-                score += 20
-            elif (difficulty == 'beginner' and resource.difficulty == 'intermediate') or \
-                 (difficulty == 'advanced' and resource.difficulty == 'intermediate'):
-                score += 10
+            score += difficulty_bonus.get(resource.difficulty, 0)
             
             # Platform reliability (based on general quality)
-            platform_scores = {
-                'youtube': 15, 'coursera': 25, 'edx': 25, 'khan_academy': 20,
-                'mit_ocw': 30, 'freecodecamp': 20, 'github': 10, 'medium': 10
-            }
-            score += platform_scores.get(resource.platform, 5)
+            score += _PLATFORM_SCORES_GET(resource.platform, 5)
             
             # Rating and popularity
             if resource.rating:
@@ -180,322 +374,404 @@ class ResourceAggregator:
                 score += min(resource.enrollment_count / 10000, 10)  # Cap at 10 points
             
             # Content type preferences
-            type_preferences = {'course': 1.2, 'video': 1.1, 'interactive': 1.15, 'article': 1.0}
-            score *= type_preferences.get(resource.type, 1.0)
-            
-            return score
+            return score * _TYPE_PREFERENCES_GET(resource.type, 1.0)
         
-        # Sort by calculated score
-        resources.sort(key=calculate_score, reverse=True)
-        return resources
+        scores = [calculate_score(resource) for resource in resources]
+        if limit is None:
+            order = sorted(range(len(resources)), key=scores.__getitem__, reverse=True)
+        else:
+            # Same order as the sorted prefix (ties keep input order)
+            order = heapq.nlargest(limit, range(len(resources)), key=scores.__getitem__)
+        return [resources[i] for i in order]
+
+class _CategoryMatcher:
+    """Finds the categories of a mock database that a search query refers to.
+    A category matches when it appears in the query or any query word
+    appears in it. Matches are cached per query, in database order."""
+    
+    def __init__(self, database: Dict[str, Any]):
+        self.categories = tuple(database)
+        # One scan finds every category inside the query: at each position the
+        # lookahead reports the longest category starting there, which also
+        # implies any shorter categories that are prefixes of it
+        by_length = sorted(self.categories, key=len, reverse=True)
+        self._contained_pattern = re.compile('(?=(%s))' % '|'.join(map(re.escape, by_length)))
+        self._implied = {key: frozenset(other for other in self.categories if key.startswith(other))
+                         for key in self.categories}
+        # Inverted index from every substring of a category to the categories
+        # containing it, so 'a query word appears in it' is one lookup per word
+        self._containing = {}
+        for key in self.categories:
+            for start in range(len(key)):
+                for end in range(start + 1, len(key) + 1):
+                    self._containing.setdefault(key[start:end], set()).add(key)
+        self.match = lru_cache(maxsize=1024)(self._match)
+    
+    def _match(self, query_lower: str) -> Tuple[str, ...]:
+        matched = set()
+        for found in self._contained_pattern.finditer(query_lower):
+            matched.update(self._implied[found.group(1)])
+        for word in query_lower.split():
+            matched.update(self._containing.get(word, ()))
+        
+        return tuple(key for key in self.categories if key in matched)
+
+class _DBAggregator(ABC):
+    """Base for aggregators answered from an in-process mock database.
+    A search returns the resources of every category the query matches,
+    or a single fallback resource when none match."""
+    
+    categories: _CategoryMatcher
+    
+    @abstractmethod
+    def _category_resources(self, key: str, difficulty: str) -> Tuple[Resource, ...]:
+        """Resources for one matched category"""
+    
+    @abstractmethod
+    def _fallback_resource(self, query: str, query_lower: str, difficulty: str) -> Resource:
+        """Resource to offer when no category matches the query"""
+    
+    def _search_db(self, query: str, difficulty: str, limit: int) -> List[Resource]:
+        query_lower = query.lower()
+        resources = []
+        
+        # Find matching categories
+        for key in self.categories.match(query_lower):
+            resources.extend(self._category_resources(key, difficulty)[:limit])
+        
+        # Fallback if no specific match
+        if not resources:
+            resources = [self._fallback_resource(query, query_lower, difficulty)]
+        
+        return resources[:limit]
 
 # Platform-specific aggregators
-class YouTubeAggregator:
-    def search_resources(self, query: str, difficulty: str, content_types: List[str], limit: int) -> List[Resource]:
+
+# Real YouTube educational channels and playlists
+_YOUTUBE_VIDEOS = {
+    'python': [
+        {
+            'id': 'yt_python_1',
+            'title': 'Python Full Course - Learn Python Programming',
+            'description': 'Complete Python tutorial for beginners covering all fundamentals',
+            'url': 'https://www.youtube.com/watch?v=_uQrJ0TkZlc',
+            'duration': 360,
+            'rating': 4.8,
+            'instructor': 'Programming with Mosh'
+        },
+        {
+            'id': 'yt_python_2', 
+            'title': 'Python Tutorial for Beginners - Full Course in 12 Hours',
+            'description': 'Learn Python programming from scratch with practical examples',
+            'url': 'https://www.youtube.com/watch?v=t8pPdKYpowI',
+            'duration': 720,
+            'rating': 4.7,
+            'instructor': 'freeCodeCamp'
+        }
+    ],
+    'javascript': [
+        {
+            'id': 'yt_js_1',
+            'title': 'JavaScript Full Course for Beginners',
+            'description': 'Complete JavaScript tutorial covering ES6+ features',
+            'url': 'https://www.youtube.com/watch?v=PkZNo7MFNFg',
+            'duration': 480,
+            'rating': 4.9,
+            'instructor': 'freeCodeCamp'
+        },
+        {
+            'id': 'yt_js_2',
+            'title': 'Modern JavaScript Tutorial - The Complete Guide',
+            'description': 'Learn modern JavaScript with real-world projects',
+            'url': 'https://www.youtube.com/watch?v=2md4HQNRqJA',
+            'duration': 540,
+            'rating': 4.6,
+            'instructor': 'Academind'
+        }
+    ],
+    'react': [
+        {
+            'id': 'yt_react_1',
+            'title': 'React Course - Beginner\'s Tutorial for React JavaScript Library',
+            'description': 'Learn React.js from scratch with hands-on projects',
+            'url': 'https://www.youtube.com/watch?v=bMknfKXIFA8',
+            'duration': 300,
+            'rating': 4.8,
+            'instructor': 'freeCodeCamp'
+        }
+    ],
+    'data science': [
+        {
+            'id': 'yt_ds_1',
+            'title': 'Data Science Full Course - Learn Data Science in 12 Hours',
+            'description': 'Complete data science tutorial with Python and real projects',
+            'url': 'https://www.youtube.com/watch?v=ua-CiDNNj30',
+            'duration': 720,
+            'rating': 4.7,
+            'instructor': 'edureka!'
+        }
+    ]
+}
+# Resources for each video category, built once
+_YOUTUBE_RESOURCES = {
+    key: tuple(
+        Resource(
+            id=video['id'],
+            title=video['title'],
+            description=video['description'],
+            url=video['url'],
+            platform='youtube',
+            type='video',
+            duration=video['duration'],
+            difficulty='beginner',
+            rating=video['rating'],
+            instructor=video['instructor'],
+            tags=_intern_tags((key, 'tutorial', 'free'))
+        )
+        for video in videos
+    )
+    for key, videos in _YOUTUBE_VIDEOS.items()
+}
+_YOUTUBE_CATEGORIES = _CategoryMatcher(_YOUTUBE_VIDEOS)
+
+class YouTubeAggregator(_DBAggregator):
+    categories = _YOUTUBE_CATEGORIES
+    
+    def search_resources(self, query: str, difficulty: str, content_types: FrozenSet[str], limit: int) -> List[Resource]:
         """Unified interface for resource searching"""
         return self.search_videos(query, limit)
     
     def search_videos(self, query: str, max_results: int = 5) -> List[Resource]:
         """Mock YouTube video search with real working URLs"""
-        # Real YouTube educational channels and playlists
-        video_database = {
-            'python': [
-                {
-                    'id': 'yt_python_1',
-                    'title': 'Python Full Course - Learn Python Programming',
-                    'description': 'Complete Python tutorial for beginners covering all fundamentals',
-                    'url': 'https://www.youtube.com/watch?v=_uQrJ0TkZlc',
-                    'duration': 360,
-                    'rating': 4.8,
-                    'instructor': 'Programming with Mosh'
-                },
-                {
-                    'id': 'yt_python_2', 
-                    'title': 'Python Tutorial for Beginners - Full Course in 12 Hours',
-                    'description': 'Learn Python programming from scratch with practical examples',
-                    'url': 'https://www.youtube.com/watch?v=t8pPdKYpowI',
-                    'duration': 720,
-                    'rating': 4.7,
-                    'instructor': 'freeCodeCamp'
-                }
-            ],
-            'javascript': [
-                {
-                    'id': 'yt_js_1',
-                    'title': 'JavaScript Full Course for Beginners',
-                    'description': 'Complete JavaScript tutorial covering ES6+ features',
-                    'url': 'https://www.youtube.com/watch?v=PkZNo7MFNFg',
-                    'duration': 480,
-                    'rating': 4.9,
-                    'instructor': 'freeCodeCamp'
-                },
-                {
-                    'id': 'yt_js_2',
-                    'title': 'Modern JavaScript Tutorial - The Complete Guide',
-                    'description': 'Learn modern JavaScript with real-world projects',
-                    'url': 'https://www.youtube.com/watch?v=2md4HQNRqJA',
-                    'duration': 540,
-                    'rating': 4.6,
-                    'instructor': 'Academind'
-                }
-            ],
-            'react': [
-                {
-                    'id': 'yt_react_1',
-                    'title': 'React Course - Beginner\'s Tutorial for React JavaScript Library',
-                    'description': 'Learn React.js from scratch with hands-on projects',
-                    'url': 'https://www.youtube.com/watch?v=bMknfKXIFA8',
-                    'duration': 300,
-                    'rating': 4.8,
-                    'instructor': 'freeCodeCamp'
-                }
-            ],
-            'data science': [
-                {
-                    'id': 'yt_ds_1',
-                    'title': 'Data Science Full Course - Learn Data Science in 12 Hours',
-                    'description': 'Complete data science tutorial with Python and real projects',
-                    'url': 'https://www.youtube.com/watch?v=ua-CiDNNj30',
-                    'duration': 720,
-                    'rating': 4.7,
-                    'instructor': 'edureka!'
-                }
-            ]
+        return self._search_db(query, 'beginner', max_results)
+    
+    def _category_resources(self, key: str, difficulty: str) -> Tuple[Resource, ...]:
+        return _YOUTUBE_RESOURCES[key]
+    
+    def _fallback_resource(self, query: str, query_lower: str, difficulty: str) -> Resource:
+        """Generic tutorial search when no video category matches"""
+        return Resource(
+            id=f'yt_generic_{next(_fallback_ids)}',
+            title=f'Learn {query.title()} - Complete Tutorial',
+            description=f'Comprehensive tutorial covering {query} fundamentals and advanced concepts',
+            url=f'https://www.youtube.com/results?search_query={_quote_query(query)}+tutorial',
+            platform='youtube',
+            type='video',
+            duration=240,
+            difficulty='beginner',
+            rating=4.5,
+            tags=(query_lower, 'tutorial', 'free')
+        )
+
+# Real Coursera courses (free to audit)
+_COURSERA_COURSES = {
+    'python': [
+        {
+            'id': 'coursera_python_1',
+            'title': 'Python for Everybody Specialization',
+            'description': 'Learn to Program and Analyze Data with Python by University of Michigan',
+            'url': 'https://www.coursera.org/specializations/python',
+            'instructor': 'University of Michigan'
+        },
+        {
+            'id': 'coursera_python_2',
+            'title': 'Programming for Everybody (Getting Started with Python)',
+            'description': 'Introduction to programming using Python by University of Michigan',
+            'url': 'https://www.coursera.org/learn/python',
+            'instructor': 'University of Michigan'
         }
-        
-        # Find matching videos
-        query_lower = query.lower()
-        resources = []
-        
-        for key, videos in video_database.items():
-            if key in query_lower or any(word in key for word in query_lower.split()):
-                for video in videos[:max_results]:
-                    resources.append(Resource(
-                        id=video['id'],
-                        title=video['title'],
-                        description=video['description'],
-                        url=video['url'],
-                        platform='youtube',
-                        type='video',
-                        duration=video['duration'],
-                        difficulty='beginner',
-                        rating=video['rating'],
-                        instructor=video['instructor'],
-                        tags=[key, 'tutorial', 'free']
-                    ))
-                    
-        # Fallback generic videos if no specific match
-        if not resources:
-            resources = [
-                Resource(
-                    id=f'yt_generic_{int(time.time())}',
-                    title=f'Learn {query.title()} - Complete Tutorial',
-                    description=f'Comprehensive tutorial covering {query} fundamentals and advanced concepts',
-                    url=f'https://www.youtube.com/results?search_query={quote(query)}+tutorial',
-                    platform='youtube',
-                    type='video',
-                    duration=240,
-                    difficulty='beginner',
-                    rating=4.5,
-                    tags=[query.lower(), 'tutorial', 'free']
-                )
-            ]
-            
-        return resources[:max_results]
+    ],
+    'machine learning': [
+        {
+            'id': 'coursera_ml_1',
+            'title': 'Machine Learning Course by Andrew Ng',
+            'description': 'The famous Machine Learning course by Stanford University',
+            'url': 'https://www.coursera.org/learn/machine-learning',
+            'instructor': 'Andrew Ng, Stanford University'
+        }
+    ],
+    'data science': [
+        {
+            'id': 'coursera_ds_1',
+            'title': 'Data Science Specialization',
+            'description': 'Complete Data Science course by Johns Hopkins University',
+            'url': 'https://www.coursera.org/specializations/jhu-data-science',
+            'instructor': 'Johns Hopkins University'
+        }
+    ],
+    'web development': [
+        {
+            'id': 'coursera_web_1',
+            'title': 'Full-Stack Web Development with React Specialization',
+            'description': 'Complete web development course by The Hong Kong University of Science and Technology',
+            'url': 'https://www.coursera.org/specializations/full-stack-react',
+            'instructor': 'The Hong Kong University of Science and Technology'
+        }
+    ]
+}
+# Resources for each course category, built once
+_COURSERA_RESOURCES = {
+    key: tuple(
+        Resource(
+            id=course['id'],
+            title=course['title'],
+            description=course['description'],
+            url=course['url'],
+            platform='coursera',
+            type='course',
+            difficulty='intermediate',
+            rating=4.6,
+            instructor=course['instructor'],
+            tags=_intern_tags((key, 'university', 'free audit'))
+        )
+        for course in courses
+    )
+    for key, courses in _COURSERA_COURSES.items()
+}
+_COURSERA_CATEGORIES = _CategoryMatcher(_COURSERA_COURSES)
 
-class CourseraAggregator:
-    def search_resources(self, query: str, difficulty: str, content_types: List[str], limit: int) -> List[Resource]:
+class CourseraAggregator(_DBAggregator):
+    categories = _COURSERA_CATEGORIES
+    
+    def search_resources(self, query: str, difficulty: str, content_types: FrozenSet[str], limit: int) -> List[Resource]:
         """Unified interface for resource searching"""
         return self.search_courses(query, limit)
     
     def search_courses(self, query: str, max_results: int = 3) -> List[Resource]:
         """Mock Coursera course search with real working URLs"""
-        course_database = {
-            'python': [
-                {
-                    'id': 'coursera_python_1',
-                    'title': 'Python for Everybody Specialization',
-                    'description': 'Learn to Program and Analyze Data with Python by University of Michigan',
-                    'url': 'https://www.coursera.org/specializations/python',
-                    'instructor': 'University of Michigan'
-                },
-                {
-                    'id': 'coursera_python_2',
-                    'title': 'Programming for Everybody (Getting Started with Python)',
-                    'description': 'Introduction to programming using Python by University of Michigan',
-                    'url': 'https://www.coursera.org/learn/python',
-                    'instructor': 'University of Michigan'
-                }
-            ],
-            'machine learning': [
-                {
-                    'id': 'coursera_ml_1',
-                    'title': 'Machine Learning Course by Andrew Ng',
-                    'description': 'The famous Machine Learning course by Stanford University',
-                    'url': 'https://www.coursera.org/learn/machine-learning',
-                    'instructor': 'Andrew Ng, Stanford University'
-                }
-            ],
-            'data science': [
-                {
-                    'id': 'coursera_ds_1',
-                    'title': 'Data Science Specialization',
-                    'description': 'Complete Data Science course by Johns Hopkins University',
-                    'url': 'https://www.coursera.org/specializations/jhu-data-science',
-                    'instructor': 'Johns Hopkins University'
-                }
-            ],
-            'web development': [
-                {
-                    'id': 'coursera_web_1',
-                    'title': 'Full-Stack Web Development with React Specialization',
-                    'description': 'Complete web development course by The Hong Kong University of Science and Technology',
-                    'url': 'https://www.coursera.org/specializations/full-stack-react',
-                    'instructor': 'The Hong Kong University of Science and Technology'
-                }
-            ]
+        return self._search_db(query, 'intermediate', max_results)
+    
+    def _category_resources(self, key: str, difficulty: str) -> Tuple[Resource, ...]:
+        return _COURSERA_RESOURCES[key]
+    
+    def _fallback_resource(self, query: str, query_lower: str, difficulty: str) -> Resource:
+        """Coursera search page when no course category matches"""
+        search_url = f'https://www.coursera.org/search?query={_quote_query(query)}&index=prod_all_launched_products_term_optimization'
+        return Resource(
+            id=f'coursera_search_{next(_fallback_ids)}',
+            title=f'{query.title()} Courses on Coursera',
+            description=f'Browse {query} courses and specializations on Coursera with free audit options',
+            url=search_url,
+            platform='coursera',
+            type='course',
+            difficulty='intermediate',
+            rating=4.4,
+            tags=(query_lower, 'university', 'free audit')
+        )
+
+# Real edX courses
+_EDX_COURSES = {
+    'python': [
+        {
+            'id': 'edx_python_1',
+            'title': 'Introduction to Computer Science and Programming Using Python',
+            'description': 'MIT\'s introduction to computer science using Python',
+            'url': 'https://www.edx.org/course/introduction-to-computer-science-and-programming-7',
+            'instructor': 'MIT'
         }
-        
-        query_lower = query.lower()
-        resources = []
-        
-        for key, courses in course_database.items():
-            if key in query_lower or any(word in key for word in query_lower.split()):
-                for course in courses[:max_results]:
-                    resources.append(Resource(
-                        id=course['id'],
-                        title=course['title'],
-                        description=course['description'],
-                        url=course['url'],
-                        platform='coursera',
-                        type='course',
-                        difficulty='intermediate',
-                        rating=4.6,
-                        instructor=course['instructor'],
-                        tags=[key, 'university', 'free audit']
-                    ))
-        
-        # Fallback search
-        if not resources:
-            search_url = f'https://www.coursera.org/search?query={quote(query)}&index=prod_all_launched_products_term_optimization'
-            resources = [
-                Resource(
-                    id=f'coursera_search_{int(time.time())}',
-                    title=f'{query.title()} Courses on Coursera',
-                    description=f'Browse {query} courses and specializations on Coursera with free audit options',
-                    url=search_url,
-                    platform='coursera',
-                    type='course',
-                    difficulty='intermediate',
-                    rating=4.4,
-                    tags=[query.lower(), 'university', 'free audit']
-                )
-            ]
-            
-        return resources[:max_results]
+    ],
+    'artificial intelligence': [
+        {
+            'id': 'edx_ai_1',
+            'title': 'Artificial Intelligence (AI)',
+            'description': 'Introduction to AI by Columbia University',
+            'url': 'https://www.edx.org/course/artificial-intelligence-ai',
+            'instructor': 'Columbia University'
+        }
+    ],
+    'data science': [
+        {
+            'id': 'edx_ds_1',
+            'title': 'Introduction to Data Science',
+            'description': 'Data Science fundamentals by Microsoft',
+            'url': 'https://www.edx.org/course/introduction-to-data-science-3',
+            'instructor': 'Microsoft'
+        }
+    ],
+    'javascript': [
+        {
+            'id': 'edx_js_1',
+            'title': 'Introduction to JavaScript',
+            'description': 'Learn JavaScript programming fundamentals',
+            'url': 'https://www.edx.org/course/javascript-introduction',
+            'instructor': 'W3C'
+        }
+    ]
+}
+# Resources for each course category, built once
+_EDX_RESOURCES = {
+    key: tuple(
+        Resource(
+            id=course['id'],
+            title=course['title'],
+            description=course['description'],
+            url=course['url'],
+            platform='edx',
+            type='course',
+            difficulty='intermediate',
+            rating=4.5,
+            instructor=course['instructor'],
+            tags=_intern_tags((key, 'university', 'free'))
+        )
+        for course in courses
+    )
+    for key, courses in _EDX_COURSES.items()
+}
+_EDX_CATEGORIES = _CategoryMatcher(_EDX_COURSES)
 
-class EdXAggregator:
-    def search_resources(self, query: str, difficulty: str, content_types: List[str], limit: int) -> List[Resource]:
+class EdXAggregator(_DBAggregator):
+    categories = _EDX_CATEGORIES
+    
+    def search_resources(self, query: str, difficulty: str, content_types: FrozenSet[str], limit: int) -> List[Resource]:
         """Unified interface for resource searching"""
         return self.search_courses(query, limit)
     
     def search_courses(self, query: str, max_results: int = 3) -> List[Resource]:
         """Mock edX course search with real working URLs"""
-        course_database = {
-            'python': [
-                {
-                    'id': 'edx_python_1',
-                    'title': 'Introduction to Computer Science and Programming Using Python',
-                    'description': 'MIT\'s introduction to computer science using Python',
-                    'url': 'https://www.edx.org/course/introduction-to-computer-science-and-programming-7',
-                    'instructor': 'MIT'
-                }
-            ],
-            'artificial intelligence': [
-                {
-                    'id': 'edx_ai_1',
-                    'title': 'Artificial Intelligence (AI)',
-                    'description': 'Introduction to AI by Columbia University',
-                    'url': 'https://www.edx.org/course/artificial-intelligence-ai',
-                    'instructor': 'Columbia University'
-                }
-            ],
-            'data science': [
-                {
-                    'id': 'edx_ds_1',
-                    'title': 'Introduction to Data Science',
-                    'description': 'Data Science fundamentals by Microsoft',
-                    'url': 'https://www.edx.org/course/introduction-to-data-science-3',
-                    'instructor': 'Microsoft'
-                }
-            ],
-            'javascript': [
-                {
-                    'id': 'edx_js_1',
-                    'title': 'Introduction to JavaScript',
-                    'description': 'Learn JavaScript programming fundamentals',
-                    'url': 'https://www.edx.org/course/javascript-introduction',
-                    'instructor': 'W3C'
-                }
-            ]
-        }
-        
-        query_lower = query.lower()
-        resources = []
-        
-        for key, courses in course_database.items():
-            if key in query_lower or any(word in key for word in query_lower.split()):
-                for course in courses[:max_results]:
-                    resources.append(Resource(
-                        id=course['id'],
-                        title=course['title'],
-                        description=course['description'],
-                        url=course['url'],
-                        platform='edx',
-                        type='course',
-                        difficulty='intermediate',
-                        rating=4.5,
-                        instructor=course['instructor'],
-                        tags=[key, 'university', 'free']
-                    ))
-        
-        # Fallback search
-        if not resources:
-            search_url = f'https://www.edx.org/search?q={quote(query)}'
-            resources = [
-                Resource(
-                    id=f'edx_search_{int(time.time())}',
-                    title=f'{query.title()} Courses on edX',
-                    description=f'Explore free {query} courses from top universities on edX',
-                    url=search_url,
-                    platform='edx',
-                    type='course',
-                    difficulty='intermediate',
-                    rating=4.3,
-                    tags=[query.lower(), 'university', 'free']
-                )
-            ]
-            
-        return resources[:max_results]
+        return self._search_db(query, 'intermediate', max_results)
+    
+    def _category_resources(self, key: str, difficulty: str) -> Tuple[Resource, ...]:
+        return _EDX_RESOURCES[key]
+    
+    def _fallback_resource(self, query: str, query_lower: str, difficulty: str) -> Resource:
+        """edX search page when no course category matches"""
+        search_url = f'https://www.edx.org/search?q={_quote_query(query)}'
+        return Resource(
+            id=f'edx_search_{next(_fallback_ids)}',
+            title=f'{query.title()} Courses on edX',
+            description=f'Explore free {query} courses from top universities on edX',
+            url=search_url,
+            platform='edx',
+            type='course',
+            difficulty='intermediate',
+            rating=4.3,
+            tags=(query_lower, 'university', 'free')
+        )
 
 class KhanAcademyAggregator:
     """Aggregate structured lessons from Khan Academy"""
     
-    def search_resources(self, query: str, difficulty: str, content_types: List[str], limit: int) -> List[Resource]:
+    # Only queries containing one of these terms have results here
+    trigger_terms = ('math', 'statistics', 'computer science', 'programming')
+    trigger_pattern = re.compile('|'.join(map(re.escape, trigger_terms)))
+    
+    def search_resources(self, query: str, difficulty: str, content_types: FrozenSet[str], limit: int) -> List[Resource]:
         resources = []
+        query_lower = query.lower()
         
         # Khan Academy is particularly good for fundamentals
-        if any(term in query.lower() for term in ['math', 'statistics', 'computer science', 'programming']):
+        if self.trigger_pattern.search(query_lower):
+            slug = query_lower.replace(' ', '-')
             resource = Resource(
-                id=f"khan_{hash(query)}",
+                id=f"khan_{_query_hash(query)}",
                 title=f"{query} - Khan Academy",
                 description=f"Interactive lessons and exercises for {query}",
-                url=f"https://khanacademy.org/computing/{query.replace(' ', '-').lower()}",
+                url=f"https://khanacademy.org/computing/{slug}",
                 platform='khan_academy',
                 type='interactive',
                 difficulty='beginner',
                 rating=4.3,
-                tags=[query, 'interactive', 'exercises']
+                tags=(query, 'interactive', 'exercises')
             )
             resources.append(resource)
         
@@ -504,22 +780,27 @@ class KhanAcademyAggregator:
 class MITOpenCourseWareAggregator:
     """Aggregate courses from MIT OpenCourseWare"""
     
-    def search_resources(self, query: str, difficulty: str, content_types: List[str], limit: int) -> List[Resource]:
+    # Only queries containing one of these terms have results here
+    trigger_terms = ('computer science', 'programming', 'algorithms', 'ai', 'machine learning')
+    trigger_pattern = re.compile('|'.join(map(re.escape, trigger_terms)))
+    
+    def search_resources(self, query: str, difficulty: str, content_types: FrozenSet[str], limit: int) -> List[Resource]:
         resources = []
+        query_lower = query.lower()
         
         # MIT OCW for computer science and engineering topics
-        if any(term in query.lower() for term in ['computer science', 'programming', 'algorithms', 'ai', 'machine learning']):
+        if self.trigger_pattern.search(query_lower):
             resource = Resource(
-                id=f"mit_{hash(query)}",
+                id=f"mit_{_query_hash(query)}",
                 title=f"MIT: {query}",
                 description=f"MIT course materials for {query}",
-                url=f"https://ocw.mit.edu/search/?q={quote(query)}",
+                url=f"https://ocw.mit.edu/search/?q={_quote_query(query)}",
                 platform='mit_ocw',
                 type='course',
                 difficulty='advanced',
                 rating=4.8,
                 instructor="MIT Faculty",
-                tags=[query, 'mit', 'academic']
+                tags=(query, 'mit', 'academic')
             )
             resources.append(resource)
         
@@ -528,13 +809,18 @@ class MITOpenCourseWareAggregator:
 class FreeCodeCampAggregator:
     """Aggregate content from freeCodeCamp"""
     
-    def search_resources(self, query: str, difficulty: str, content_types: List[str], limit: int) -> List[Resource]:
+    # Only queries containing one of these terms have results here
+    trigger_terms = ('web', 'javascript', 'html', 'css', 'programming', 'coding')
+    trigger_pattern = re.compile('|'.join(map(re.escape, trigger_terms)))
+    
+    def search_resources(self, query: str, difficulty: str, content_types: FrozenSet[str], limit: int) -> List[Resource]:
         resources = []
+        query_lower = query.lower()
         
         # freeCodeCamp for web development and programming
-        if any(term in query.lower() for term in ['web', 'javascript', 'html', 'css', 'programming', 'coding']):
+        if self.trigger_pattern.search(query_lower):
             resource = Resource(
-                id=f"fcc_{hash(query)}",
+                id=f"fcc_{_query_hash(query)}",
                 title=f"freeCodeCamp: {query}",
                 description=f"Learn {query} with hands-on projects",
                 url=f"https://freecodecamp.org/learn",
@@ -542,384 +828,391 @@ class FreeCodeCampAggregator:
                 type='interactive',
                 difficulty='beginner',
                 rating=4.5,
-                tags=[query, 'projects', 'certification']
+                tags=(query, 'projects', 'certification')
             )
             resources.append(resource)
         
         return resources
 
-class GitHubAggregator:
+# Real GitHub repositories database
+_GITHUB_REPOS = {
+    'python': [
+        {
+            'id': 'github_python_1',
+            'name': 'awesome-python',
+            'description': 'An opinionated list of awesome Python frameworks, libraries, software and resources',
+            'url': 'https://github.com/vinta/awesome-python',
+            'stars': 180000
+        },
+        {
+            'id': 'github_python_2', 
+            'name': 'python-patterns',
+            'description': 'A collection of design patterns/idioms in Python',
+            'url': 'https://github.com/faif/python-patterns',
+            'stars': 38000
+        },
+        {
+            'id': 'github_python_3',
+            'name': 'Python-100-Days',
+            'description': 'Python - 100天从新手到大师',
+            'url': 'https://github.com/jackfrued/Python-100-Days',
+            'stars': 145000
+        }
+    ],
+    'javascript': [
+        {
+            'id': 'github_js_1',
+            'name': 'awesome-javascript',
+            'description': 'A collection of awesome browser-side JavaScript libraries, resources and shiny things',
+            'url': 'https://github.com/sorrycc/awesome-javascript',
+            'stars': 32000
+        },
+        {
+            'id': 'github_js_2',
+            'name': 'javascript-algorithms',
+            'description': 'Algorithms and data structures implemented in JavaScript with explanations and links to further readings',
+            'url': 'https://github.com/trekhleb/javascript-algorithms',
+            'stars': 182000
+        },
+        {
+            'id': 'github_js_3',
+            'name': '30-seconds-of-code',
+            'description': 'Short JavaScript code snippets for all your development needs',
+            'url': 'https://github.com/30-seconds/30-seconds-of-code',
+            'stars': 118000
+        }
+    ],
+    'react': [
+        {
+            'id': 'github_react_1',
+            'name': 'awesome-react',
+            'description': 'A collection of awesome things regarding React ecosystem',
+            'url': 'https://github.com/enaqx/awesome-react',
+            'stars': 60000
+        },
+        {
+            'id': 'github_react_2',
+            'name': 'react-developer-roadmap',
+            'description': 'Roadmap to becoming a React developer',
+            'url': 'https://github.com/adam-golab/react-developer-roadmap',
+            'stars': 18000
+        }
+    ],
+    'machine learning': [
+        {
+            'id': 'github_ml_1',
+            'name': 'awesome-machine-learning',
+            'description': 'A curated list of awesome Machine Learning frameworks, libraries and software',
+            'url': 'https://github.com/josephmisiti/awesome-machine-learning',
+            'stars': 63000
+        },
+        {
+            'id': 'github_ml_2',
+            'name': 'ml-course-notes',
+            'description': 'Machine learning course notes and code',
+            'url': 'https://github.com/dair-ai/ML-Course-Notes',
+            'stars': 8500
+        }
+    ],
+    'data science': [
+        {
+            'id': 'github_ds_1',
+            'name': 'awesome-datascience',
+            'description': 'An awesome Data Science repository to learn and apply for real world problems',
+            'url': 'https://github.com/academic/awesome-datascience',
+            'stars': 23000
+        },
+        {
+            'id': 'github_ds_2',
+            'name': 'data-science-notebooks',
+            'description': 'A curated list of data science Python notebooks',
+            'url': 'https://github.com/donnemartin/data-science-ipython-notebooks',
+            'stars': 26000
+        }
+    ],
+    'web development': [
+        {
+            'id': 'github_web_1',
+            'name': 'developer-roadmap',
+            'description': 'Interactive roadmaps, guides and other educational content to help developers grow',
+            'url': 'https://github.com/kamranahmedse/developer-roadmap',
+            'stars': 280000
+        },
+        {
+            'id': 'github_web_2',
+            'name': 'awesome-web-development',
+            'description': 'A curated list of awesome Web Development resources',
+            'url': 'https://github.com/FortAwesome/awesome-web-development',
+            'stars': 6000
+        }
+    ]
+}
+@lru_cache(maxsize=256)
+def _github_resources(key: str, difficulty: str) -> Tuple[Resource, ...]:
+    """Resources for one repository category at a difficulty (built once)"""
+    return tuple(
+        Resource(
+            id=repo['id'],
+            title=repo['name'],
+            description=repo['description'],
+            url=repo['url'],
+            platform='github',
+            type='article',
+            difficulty=difficulty,
+            enrollment_count=repo['stars'],
+            tags=_intern_tags((key, 'open-source', 'tutorial', 'repository'))
+        )
+        for repo in _GITHUB_REPOS[key]
+    )
+_GITHUB_CATEGORIES = _CategoryMatcher(_GITHUB_REPOS)
+
+class GitHubAggregator(_DBAggregator):
     """Aggregate educational repositories and tutorials from GitHub"""
     
-    def search_resources(self, query: str, difficulty: str, content_types: List[str], limit: int) -> List[Resource]:
-        # Real GitHub repositories database
-        github_database = {
-            'python': [
-                {
-                    'id': 'github_python_1',
-                    'name': 'awesome-python',
-                    'description': 'An opinionated list of awesome Python frameworks, libraries, software and resources',
-                    'url': 'https://github.com/vinta/awesome-python',
-                    'stars': 180000
-                },
-                {
-                    'id': 'github_python_2', 
-                    'name': 'python-patterns',
-                    'description': 'A collection of design patterns/idioms in Python',
-                    'url': 'https://github.com/faif/python-patterns',
-                    'stars': 38000
-                },
-                {
-                    'id': 'github_python_3',
-                    'name': 'Python-100-Days',
-                    'description': 'Python - 100天从新手到大师',
-                    'url': 'https://github.com/jackfrued/Python-100-Days',
-                    'stars': 145000
-                }
-            ],
-            'javascript': [
-                {
-                    'id': 'github_js_1',
-                    'name': 'awesome-javascript',
-                    'description': 'A collection of awesome browser-side JavaScript libraries, resources and shiny things',
-                    'url': 'https://github.com/sorrycc/awesome-javascript',
-                    'stars': 32000
-                },
-                {
-                    'id': 'github_js_2',
-                    'name': 'javascript-algorithms',
-                    'description': 'Algorithms and data structures implemented in JavaScript with explanations and links to further readings',
-                    'url': 'https://github.com/trekhleb/javascript-algorithms',
-                    'stars': 182000
-                },
-                {
-                    'id': 'github_js_3',
-                    'name': '30-seconds-of-code',
-                    'description': 'Short JavaScript code snippets for all your development needs',
-                    'url': 'https://github.com/30-seconds/30-seconds-of-code',
-                    'stars': 118000
-                }
-            ],
-            'react': [
-                {
-                    'id': 'github_react_1',
-                    'name': 'awesome-react',
-                    'description': 'A collection of awesome things regarding React ecosystem',
-                    'url': 'https://github.com/enaqx/awesome-react',
-                    'stars': 60000
-                },
-                {
-                    'id': 'github_react_2',
-                    'name': 'react-developer-roadmap',
-                    'description': 'Roadmap to becoming a React developer',
-                    'url': 'https://github.com/adam-golab/react-developer-roadmap',
-                    'stars': 18000
-                }
-            ],
-            'machine learning': [
-                {
-                    'id': 'github_ml_1',
-                    'name': 'awesome-machine-learning',
-                    'description': 'A curated list of awesome Machine Learning frameworks, libraries and software',
-                    'url': 'https://github.com/josephmisiti/awesome-machine-learning',
-                    'stars': 63000
-                },
-                {
-                    'id': 'github_ml_2',
-                    'name': 'ml-course-notes',
-                    'description': 'Machine learning course notes and code',
-                    'url': 'https://github.com/dair-ai/ML-Course-Notes',
-                    'stars': 8500
-                }
-            ],
-            'data science': [
-                {
-                    'id': 'github_ds_1',
-                    'name': 'awesome-datascience',
-                    'description': 'An awesome Data Science repository to learn and apply for real world problems',
-                    'url': 'https://github.com/academic/awesome-datascience',
-                    'stars': 23000
-                },
-                {
-                    'id': 'github_ds_2',
-                    'name': 'data-science-notebooks',
-                    'description': 'A curated list of data science Python notebooks',
-                    'url': 'https://github.com/donnemartin/data-science-ipython-notebooks',
-                    'stars': 26000
-                }
-            ],
-            'web development': [
-                {
-                    'id': 'github_web_1',
-                    'name': 'developer-roadmap',
-                    'description': 'Interactive roadmaps, guides and other educational content to help developers grow',
-                    'url': 'https://github.com/kamranahmedse/developer-roadmap',
-                    'stars': 280000
-                },
-                {
-                    'id': 'github_web_2',
-                    'name': 'awesome-web-development',
-                    'description': 'A curated list of awesome Web Development resources',
-                    'url': 'https://github.com/FortAwesome/awesome-web-development',
-                    'stars': 6000
-                }
-            ]
+    categories = _GITHUB_CATEGORIES
+    
+    def search_resources(self, query: str, difficulty: str, content_types: FrozenSet[str], limit: int) -> List[Resource]:
+        return self._search_db(query, difficulty, limit)
+    
+    def _category_resources(self, key: str, difficulty: str) -> Tuple[Resource, ...]:
+        return _github_resources(key, difficulty)
+    
+    def _fallback_resource(self, query: str, query_lower: str, difficulty: str) -> Resource:
+        """General repository search when no category matches"""
+        search_url = f'https://github.com/search?q={_quote_query(query)}+awesome&type=repositories&s=stars&o=desc'
+        return Resource(
+            id=f'github_search_{next(_fallback_ids)}',
+            title=f'Search GitHub for {query.title()}',
+            description=f'Find {query} repositories, tutorials, and resources on GitHub',
+            url=search_url,
+            platform='github',
+            type='article',
+            difficulty=difficulty,
+            tags=(query_lower, 'search', 'repositories')
+        )
+
+# Real Medium articles database
+_MEDIUM_ARTICLES = {
+    'python': [
+        {
+            'id': 'medium_python_1',
+            'title': 'Python Best Practices for Better Code',
+            'description': 'Learn Python best practices that will make your code more readable and maintainable',
+            'url': 'https://medium.com/@bretcameron/python-best-practices-for-better-code-b2da2b94f60e',
+            'author': 'Bret Cameron'
+        },
+        {
+            'id': 'medium_python_2',
+            'title': 'Advanced Python Features You Should Know',
+            'description': 'Explore advanced Python features that can make your code more efficient and pythonic',
+            'url': 'https://medium.com/towards-data-science/advanced-python-features-you-should-know-b0d7fe8b2eb5',
+            'author': 'Towards Data Science'
         }
-        
-        query_lower = query.lower()
-        resources = []
-        
-        # Find matching repositories
-        for key, repos in github_database.items():
-            if key in query_lower or any(word in key for word in query_lower.split()):
-                for repo in repos[:limit]:
-                    resources.append(Resource(
-                        id=repo['id'],
-                        title=repo['name'],
-                        description=repo['description'],
-                        url=repo['url'],
-                        platform='github',
-                        type='article',
-                        difficulty=difficulty,
-                        enrollment_count=repo['stars'],
-                        tags=[key, 'open-source', 'tutorial', 'repository']
-                    ))
-        
-        # Fallback to general search if no specific matches
-        if not resources:
-            search_url = f'https://github.com/search?q={quote(query)}+awesome&type=repositories&s=stars&o=desc'
-            resources = [
-                Resource(
-                    id=f'github_search_{int(time.time())}',
-                    title=f'Search GitHub for {query.title()}',
-                    description=f'Find {query} repositories, tutorials, and resources on GitHub',
-                    url=search_url,
-                    platform='github',
-                    type='article',
-                    difficulty=difficulty,
-                    tags=[query.lower(), 'search', 'repositories']
-                )
-            ]
-        
-        return resources[:limit]
+    ],
+    'javascript': [
+        {
+            'id': 'medium_js_1',
+            'title': 'JavaScript ES6+ Features You Should Know',
+            'description': 'Modern JavaScript features that every developer should understand',
+            'url': 'https://medium.com/javascript-scene/javascript-es6-features-you-should-know-7c0c8e3c2ac2',
+            'author': 'JavaScript Scene'
+        },
+        {
+            'id': 'medium_js_2',
+            'title': 'Understanding JavaScript Closures',
+            'description': 'A deep dive into one of JavaScript\'s most important concepts',
+            'url': 'https://medium.com/@brettflorio/understanding-javascript-closures-a-practical-approach-a6e5c5f8f90b',
+            'author': 'Brett Florio'
+        }
+    ],
+    'react': [
+        {
+            'id': 'medium_react_1',
+            'title': 'React Hooks: A Complete Guide',
+            'description': 'Everything you need to know about React Hooks',
+            'url': 'https://medium.com/@dan_abramov/react-hooks-a-complete-guide-e9d8d8d7e0f1',
+            'author': 'Dan Abramov'
+        }
+    ],
+    'machine learning': [
+        {
+            'id': 'medium_ml_1',
+            'title': 'Machine Learning Explained for Beginners',
+            'description': 'A beginner-friendly introduction to machine learning concepts',
+            'url': 'https://medium.com/towards-data-science/machine-learning-explained-for-beginners-3e1d1f8e5c0a',
+            'author': 'Towards Data Science'
+        },
+        {
+            'id': 'medium_ml_2',
+            'title': 'Understanding Neural Networks',
+            'description': 'A comprehensive guide to neural networks and deep learning',
+            'url': 'https://medium.com/@jasonbrownlee/understanding-neural-networks-a-complete-guide-f8e5e3f6e8f1',
+            'author': 'Jason Brownlee'
+        }
+    ],
+    'data science': [
+        {
+            'id': 'medium_ds_1',
+            'title': 'Data Science Project Life Cycle',
+            'description': 'A complete guide to managing data science projects from start to finish',
+            'url': 'https://medium.com/towards-data-science/data-science-project-life-cycle-c8e8e3f5d5a2',
+            'author': 'Towards Data Science'
+        }
+    ],
+    'web development': [
+        {
+            'id': 'medium_web_1',
+            'title': 'Frontend vs Backend Development',
+            'description': 'Understanding the differences and choosing the right path',
+            'url': 'https://medium.com/@bretcameron/frontend-vs-backend-development-choosing-the-right-path-a5e5e3f6e8f1',
+            'author': 'Bret Cameron'
+        }
+    ]
+}
+@lru_cache(maxsize=256)
+def _medium_resources(key: str, difficulty: str) -> Tuple[Resource, ...]:
+    """Resources for one article category at a difficulty (built once)"""
+    return tuple(
+        Resource(
+            id=article['id'],
+            title=article['title'],
+            description=article['description'],
+            url=article['url'],
+            platform='medium',
+            type='article',
+            difficulty=difficulty,
+            rating=4.2,
+            instructor=article['author'],
+            tags=_intern_tags((key, 'article', 'blog', 'explanation'))
+        )
+        for article in _MEDIUM_ARTICLES[key]
+    )
+_MEDIUM_CATEGORIES = _CategoryMatcher(_MEDIUM_ARTICLES)
 
-class MediumAggregator:
+class MediumAggregator(_DBAggregator):
     """Aggregate articles from Medium and other blog platforms"""
     
-    def search_resources(self, query: str, difficulty: str, content_types: List[str], limit: int) -> List[Resource]:
-        # Real Medium articles database
-        medium_database = {
-            'python': [
-                {
-                    'id': 'medium_python_1',
-                    'title': 'Python Best Practices for Better Code',
-                    'description': 'Learn Python best practices that will make your code more readable and maintainable',
-                    'url': 'https://medium.com/@bretcameron/python-best-practices-for-better-code-b2da2b94f60e',
-                    'author': 'Bret Cameron'
-                },
-                {
-                    'id': 'medium_python_2',
-                    'title': 'Advanced Python Features You Should Know',
-                    'description': 'Explore advanced Python features that can make your code more efficient and pythonic',
-                    'url': 'https://medium.com/towards-data-science/advanced-python-features-you-should-know-b0d7fe8b2eb5',
-                    'author': 'Towards Data Science'
-                }
-            ],
-            'javascript': [
-                {
-                    'id': 'medium_js_1',
-                    'title': 'JavaScript ES6+ Features You Should Know',
-                    'description': 'Modern JavaScript features that every developer should understand',
-                    'url': 'https://medium.com/javascript-scene/javascript-es6-features-you-should-know-7c0c8e3c2ac2',
-                    'author': 'JavaScript Scene'
-                },
-                {
-                    'id': 'medium_js_2',
-                    'title': 'Understanding JavaScript Closures',
-                    'description': 'A deep dive into one of JavaScript\'s most important concepts',
-                    'url': 'https://medium.com/@brettflorio/understanding-javascript-closures-a-practical-approach-a6e5c5f8f90b',
-                    'author': 'Brett Florio'
-                }
-            ],
-            'react': [
-                {
-                    'id': 'medium_react_1',
-                    'title': 'React Hooks: A Complete Guide',
-                    'description': 'Everything you need to know about React Hooks',
-                    'url': 'https://medium.com/@dan_abramov/react-hooks-a-complete-guide-e9d8d8d7e0f1',
-                    'author': 'Dan Abramov'
-                }
-            ],
-            'machine learning': [
-                {
-                    'id': 'medium_ml_1',
-                    'title': 'Machine Learning Explained for Beginners',
-                    'description': 'A beginner-friendly introduction to machine learning concepts',
-                    'url': 'https://medium.com/towards-data-science/machine-learning-explained-for-beginners-3e1d1f8e5c0a',
-                    'author': 'Towards Data Science'
-                },
-                {
-                    'id': 'medium_ml_2',
-                    'title': 'Understanding Neural Networks',
-                    'description': 'A comprehensive guide to neural networks and deep learning',
-                    'url': 'https://medium.com/@jasonbrownlee/understanding-neural-networks-a-complete-guide-f8e5e3f6e8f1',
-                    'author': 'Jason Brownlee'
-                }
-            ],
-            'data science': [
-                {
-                    'id': 'medium_ds_1',
-                    'title': 'Data Science Project Life Cycle',
-                    'description': 'A complete guide to managing data science projects from start to finish',
-                    'url': 'https://medium.com/towards-data-science/data-science-project-life-cycle-c8e8e3f5d5a2',
-                    'author': 'Towards Data Science'
-                }
-            ],
-            'web development': [
-                {
-                    'id': 'medium_web_1',
-                    'title': 'Frontend vs Backend Development',
-                    'description': 'Understanding the differences and choosing the right path',
-                    'url': 'https://medium.com/@bretcameron/frontend-vs-backend-development-choosing-the-right-path-a5e5e3f6e8f1',
-                    'author': 'Bret Cameron'
-                }
-            ]
+    categories = _MEDIUM_CATEGORIES
+    
+    def search_resources(self, query: str, difficulty: str, content_types: FrozenSet[str], limit: int) -> List[Resource]:
+        return self._search_db(query, difficulty, limit)
+    
+    def _category_resources(self, key: str, difficulty: str) -> Tuple[Resource, ...]:
+        return _medium_resources(key, difficulty)
+    
+    def _fallback_resource(self, query: str, query_lower: str, difficulty: str) -> Resource:
+        """Medium search page when no article category matches"""
+        search_url = f'https://medium.com/search?q={_quote_query(query)}'
+        return Resource(
+            id=f'medium_search_{next(_fallback_ids)}',
+            title=f'Search Medium for {query.title()} Articles',
+            description=f'Discover {query} articles and tutorials on Medium',
+            url=search_url,
+            platform='medium',
+            type='article',
+            difficulty=difficulty,
+            rating=4.0,
+            tags=(query_lower, 'search', 'articles')
+        )
+
+# Real podcast database
+_PODCASTS = {
+    'python': [
+        {
+            'id': 'podcast_python_1',
+            'title': 'Python Bytes - Python News & Headlines',
+            'description': 'Python headlines delivered directly to your earbuds',
+            'url': 'https://pythonbytes.fm/',
+            'duration': 30
+        },
+        {
+            'id': 'podcast_python_2',
+            'title': 'Talk Python To Me',
+            'description': 'Weekly podcast on Python and related technologies',
+            'url': 'https://talkpython.fm/',
+            'duration': 60
         }
-        
-        query_lower = query.lower()
-        resources = []
-        
-        # Find matching articles
-        for key, articles in medium_database.items():
-            if key in query_lower or any(word in key for word in query_lower.split()):
-                for article in articles[:limit]:
-                    resources.append(Resource(
-                        id=article['id'],
-                        title=article['title'],
-                        description=article['description'],
-                        url=article['url'],
-                        platform='medium',
-                        type='article',
-                        difficulty=difficulty,
-                        rating=4.2,
-                        instructor=article['author'],
-                        tags=[key, 'article', 'blog', 'explanation']
-                    ))
-        
-        # Fallback to search page
-        if not resources:
-            search_url = f'https://medium.com/search?q={quote(query)}'
-            resources = [
-                Resource(
-                    id=f'medium_search_{int(time.time())}',
-                    title=f'Search Medium for {query.title()} Articles',
-                    description=f'Discover {query} articles and tutorials on Medium',
-                    url=search_url,
-                    platform='medium',
-                    type='article',
-                    difficulty=difficulty,
-                    rating=4.0,
-                    tags=[query.lower(), 'search', 'articles']
-                )
-            ]
-        
-        return resources[:limit]
+    ],
+    'javascript': [
+        {
+            'id': 'podcast_js_1',
+            'title': 'JavaScript Jabber',
+            'description': 'Weekly podcast discussing JavaScript including Node.js, Front-End Technologies, Careers, Teams and more',
+            'url': 'https://topenddevs.com/podcasts/javascript-jabber',
+            'duration': 50
+        }
+    ],
+    'web development': [
+        {
+            'id': 'podcast_web_1',
+            'title': 'Syntax - Tasty Web Development Treats',
+            'description': 'Full Stack Developers Wes Bos and Scott Tolinski dive deep into web development topics',
+            'url': 'https://syntax.fm/',
+            'duration': 45
+        },
+        {
+            'id': 'podcast_web_2',
+            'title': 'The Changelog',
+            'description': 'Conversations with the hackers, leaders, and innovators of the software world',
+            'url': 'https://changelog.com/podcast',
+            'duration': 60
+        }
+    ],
+    'data science': [
+        {
+            'id': 'podcast_ds_1',
+            'title': 'Data Skeptic',
+            'description': 'The Data Skeptic Podcast features interviews and discussion of topics related to data science, statistics, machine learning, artificial intelligence and the like',
+            'url': 'https://dataskeptic.com/',
+            'duration': 40
+        }
+    ]
+}
+@lru_cache(maxsize=256)
+def _podcast_resources(key: str, difficulty: str) -> Tuple[Resource, ...]:
+    """Resources for one podcast category at a difficulty (built once)"""
+    return tuple(
+        Resource(
+            id=podcast['id'],
+            title=podcast['title'],
+            description=podcast['description'],
+            url=podcast['url'],
+            platform='podcast',
+            type='podcast',
+            duration=podcast['duration'],
+            difficulty=difficulty,
+            rating=4.1,
+            tags=_intern_tags((key, 'discussion', 'experts', 'podcast'))
+        )
+        for podcast in _PODCASTS[key]
+    )
+_PODCAST_CATEGORIES = _CategoryMatcher(_PODCASTS)
 
-class PodcastAggregator:
+class PodcastAggregator(_DBAggregator):
     """Aggregate educational podcasts"""
     
-    def search_resources(self, query: str, difficulty: str, content_types: List[str], limit: int) -> List[Resource]:
-        # Real podcast database
-        podcast_database = {
-            'python': [
-                {
-                    'id': 'podcast_python_1',
-                    'title': 'Python Bytes - Python News & Headlines',
-                    'description': 'Python headlines delivered directly to your earbuds',
-                    'url': 'https://pythonbytes.fm/',
-                    'duration': 30
-                },
-                {
-                    'id': 'podcast_python_2',
-                    'title': 'Talk Python To Me',
-                    'description': 'Weekly podcast on Python and related technologies',
-                    'url': 'https://talkpython.fm/',
-                    'duration': 60
-                }
-            ],
-            'javascript': [
-                {
-                    'id': 'podcast_js_1',
-                    'title': 'JavaScript Jabber',
-                    'description': 'Weekly podcast discussing JavaScript including Node.js, Front-End Technologies, Careers, Teams and more',
-                    'url': 'https://topenddevs.com/podcasts/javascript-jabber',
-                    'duration': 50
-                }
-            ],
-            'web development': [
-                {
-                    'id': 'podcast_web_1',
-                    'title': 'Syntax - Tasty Web Development Treats',
-                    'description': 'Full Stack Developers Wes Bos and Scott Tolinski dive deep into web development topics',
-                    'url': 'https://syntax.fm/',
-                    'duration': 45
-                },
-                {
-                    'id': 'podcast_web_2',
-                    'title': 'The Changelog',
-                    'description': 'Conversations with the hackers, leaders, and innovators of the software world',
-                    'url': 'https://changelog.com/podcast',
-                    'duration': 60
-                }
-            ],
-            'data science': [
-                {
-                    'id': 'podcast_ds_1',
-                    'title': 'Data Skeptic',
-                    'description': 'The Data Skeptic Podcast features interviews and discussion of topics related to data science, statistics, machine learning, artificial intelligence and the like',
-                    'url': 'https://dataskeptic.com/',
-                    'duration': 40
-                }
-            ]
-        }
-        
-        resources = []
-        query_lower = query.lower()
-        
+    categories = _PODCAST_CATEGORIES
+    
+    def search_resources(self, query: str, difficulty: str, content_types: FrozenSet[str], limit: int) -> List[Resource]:
         # Mock podcast episodes
-        if 'podcast' in content_types:
-            # Find matching podcasts
-            for key, podcasts in podcast_database.items():
-                if key in query_lower or any(word in key for word in query_lower.split()):
-                    for podcast in podcasts[:limit]:
-                        resources.append(Resource(
-                            id=podcast['id'],
-                            title=podcast['title'],
-                            description=podcast['description'],
-                            url=podcast['url'],
-                            platform='podcast',
-                            type='podcast',
-                            duration=podcast['duration'],
-                            difficulty=difficulty,
-                            rating=4.1,
-                            tags=[key, 'discussion', 'experts', 'podcast']
-                        ))
-            
-            # Fallback to general tech podcasts if no specific match
-            if not resources:
-                resources = [
-                    Resource(
-                        id=f'podcast_general_{int(time.time())}',
-                        title='CodeNewbie Podcast',
-                        description='Stories from people on their coding journey',
-                        url='https://www.codenewbie.org/podcast',
-                        platform='podcast',
-                        type='podcast',
-                        duration=45,
-                        difficulty=difficulty,
-                        rating=4.3,
-                        tags=[query.lower(), 'beginner-friendly', 'coding stories']
-                    )
-                ]
-        
-        return resources[:limit]
\ No newline at end of file
+        if 'podcast' not in content_types:
+            return []
+        return self._search_db(query, difficulty, limit)
+    
+    def _category_resources(self, key: str, difficulty: str) -> Tuple[Resource, ...]:
+        return _podcast_resources(key, difficulty)
+    
+    def _fallback_resource(self, query: str, query_lower: str, difficulty: str) -> Resource:
+        """General tech podcast when no specific category matches"""
+        return Resource(
+            id=f'podcast_general_{next(_fallback_ids)}',
+            title='CodeNewbie Podcast',
+            description='Stories from people on their coding journey',
+            url='https://www.codenewbie.org/podcast',
+            platform='podcast',
+            type='podcast',
+            duration=45,
+            difficulty=difficulty,
+            rating=4.3,
+            tags=(query_lower, 'beginner-friendly', 'coding stories')
+        )
\ No newline at end of file
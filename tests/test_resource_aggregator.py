@@ -0,0 +1,141 @@
+import contextlib
+import io
+import random
+import unittest
+
+from resource_aggregator import (
+    _COURSERA_COURSES, _EDX_COURSES, _GITHUB_REPOS, _MEDIUM_ARTICLES, _PODCASTS,
+    _SKILL_KEYWORDS, _YOUTUBE_VIDEOS, _CategoryMatcher, _TTLCache, _expand_topic,
+    Resource, ResourceAggregator,
+)
+
+_DATABASES = {
+    'youtube': _YOUTUBE_VIDEOS,
+    'coursera': _COURSERA_COURSES,
+    'edx': _EDX_COURSES,
+    'github': _GITHUB_REPOS,
+    'medium': _MEDIUM_ARTICLES,
+    'podcast': _PODCASTS,
+    # Keys that are prefixes or substrings of one another
+    'overlapping': dict.fromkeys(['java', 'javascript', 'script', 'c', 'c++',
+                                  'machine learning', 'learning', 'data', 'data science']),
+}
+
+
+def _random_text(rng: random.Random, fragments: list) -> str:
+    """Glue fragments of known terms and stray characters together"""
+    parts = []
+    for _ in range(rng.randint(1, 4)):
+        fragment = rng.choice(fragments)
+        start = rng.randrange(len(fragment))
+        parts.append(fragment[start:rng.randint(start + 1, len(fragment))])
+        parts.append(rng.choice(['', ' ', ' ', '-', 'x']))
+    text = ''.join(parts)
+    return text.upper() if rng.random() < 0.1 else text
+
+
+class ExpandTopicTest(unittest.TestCase):
+    """_expand_topic must agree with the original keyword loop"""
+
+    @staticmethod
+    def _reference(topic: str) -> tuple:
+        terms = [topic]
+        topic_lower = topic.lower()
+        for skill, keywords in _SKILL_KEYWORDS.items():
+            if skill in topic_lower or any(keyword in topic_lower for keyword in keywords):
+                terms.extend(keywords[:2])
+                break
+        unique_terms = {}
+        for term in terms:
+            unique_terms.setdefault(term.lower(), term)
+        return tuple(unique_terms.values())
+
+    def test_known_topics(self):
+        for topic in ('Python', 'Machine Learning', 'SQL', 'web development',
+                      'Deep learning with Python', 'statistics', 'Cooking'):
+            self.assertEqual(_expand_topic(topic), self._reference(topic), topic)
+
+    def test_matches_reference_on_random_topics(self):
+        rng = random.Random(0)
+        fragments = [term for skill, keywords in _SKILL_KEYWORDS.items()
+                     for term in (skill, *keywords)]
+        for _ in range(20000):
+            topic = _random_text(rng, fragments)
+            self.assertEqual(_expand_topic(topic), self._reference(topic), topic)
+
+
+class CategoryMatcherTest(unittest.TestCase):
+    """_CategoryMatcher must agree with the original per-category test"""
+
+    @staticmethod
+    def _reference(database: dict, query_lower: str) -> tuple:
+        return tuple(key for key in database
+                     if key in query_lower or any(word in key for word in query_lower.split()))
+
+    def test_matches_reference_on_random_queries(self):
+        rng = random.Random(0)
+        for name, database in _DATABASES.items():
+            matcher = _CategoryMatcher(database)
+            fragments = list(database)
+            for _ in range(10000):
+                query_lower = _random_text(rng, fragments).lower()
+                self.assertEqual(matcher.match(query_lower), self._reference(database, query_lower),
+                                 (name, query_lower))
+
+
+class TTLCacheTest(unittest.TestCase):
+
+    def test_entries_expire_after_ttl(self):
+        cache = _TTLCache(maxsize=4, ttl=0)
+        cache.set('key', 'value')
+        self.assertIsNone(cache.get('key'))
+
+    def test_evicts_least_recently_used(self):
+        cache = _TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)  # 'b' is now the oldest
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+
+
+class _StubPlatform:
+    """Platform that counts searches and optionally fails them"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = 0
+
+    def search_resources(self, query, difficulty, content_types, limit):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError('platform unavailable')
+        return [Resource(id='stub_1', title='Stub Resource Title', description='',
+                         url='https://example.com/stub', platform='stub', type='article')]
+
+
+class FindResourcesCacheTest(unittest.TestCase):
+
+    def _search_twice(self, platforms: dict) -> list:
+        aggregator = ResourceAggregator()
+        aggregator.platforms = platforms
+        with contextlib.redirect_stdout(io.StringIO()):
+            return [aggregator.find_resources('Cooking', limit=5) for _ in range(2)]
+
+    def test_complete_results_are_cached(self):
+        working = _StubPlatform()
+        first, second = self._search_twice({'working': working})
+        self.assertEqual(working.calls, 1)
+        self.assertEqual(first, second)
+
+    def test_partial_results_are_not_cached(self):
+        working, failing = _StubPlatform(), _StubPlatform(fail=True)
+        first, second = self._search_twice({'working': working, 'failing': failing})
+        self.assertEqual((working.calls, failing.calls), (2, 2))
+        self.assertEqual([resource.id for resource in first], ['stub_1'])
+
+
+if __name__ == '__main__':
+    unittest.main()